@@ -1,11 +1,11 @@
 "use client";
 
-import { useState, useEffect, useRef, useCallback } from "react";
+import { useState, useEffect, useRef } from "react";
 import Link from "next/link";
 import { useParams } from "next/navigation";
 import { useSession } from "next-auth/react";
 import DOMPurify from "dompurify";
-import { PLANETS, PHASES, getPhaseForPlanet } from "@/lib/roteData";
+import { PLANETS, PHASES } from "@/lib/roteData";
 import { useInstructionModal } from "@/components/InstructionModalContext";
 
 // Mapping from planet IDs to image filenames
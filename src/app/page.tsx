@@ -3,7 +3,7 @@
 import { useState } from "react";
 import Link from "next/link";
 import { useSession } from "next-auth/react";
-import { PHASES, PLANETS, getPlanetsByPhase, Planet } from "@/lib/roteData";
+import { PHASES, getPlanetsByPhase, Planet } from "@/lib/roteData";
 
 export default function HomePage() {
   const { data: session } = useSession();
@@ -1,7 +1,5 @@
 "use client";
 
-import React from "react";
-
 interface MissionIcon {
   id: string;
   type: "combat" | "fleet" | "special";
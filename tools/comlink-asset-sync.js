@@ -11,6 +11,7 @@
 
 const fs = require('fs').promises;
 const path = require('path');
+const ComlinkClient = require('./comlink-client');
 
 // Configuration
 const CONFIG = {
@@ -34,6 +35,7 @@ class ComlinkAssetSync {
       errors: []
     };
     this.forceSync = process.argv.includes('--force');
+    this.comlink = new ComlinkClient(CONFIG.comlinkUrl);
   }
 
   log(message, level = 'info') {
@@ -47,65 +49,43 @@ class ComlinkAssetSync {
     console.log(`${prefix} ${message}`);
   }
 
-  /**
-   * POST request to Comlink API
-   */
-  async comlinkPost(endpoint, body = {}) {
-    try {
-      const response = await fetch(`${CONFIG.comlinkUrl}${endpoint}`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify(body)
-      });
-      
-      if (!response.ok) {
-        throw new Error(`Comlink ${endpoint} failed: ${response.status}`);
-      }
-      
-      return response.json();
-    } catch (error) {
-      if (error.cause?.code === 'ECONNREFUSED') {
-        throw new Error(`Comlink not running at ${CONFIG.comlinkUrl}. Start it with: docker start swgoh-comlink`);
-      }
-      throw error;
-    }
-  }
-
   /**
    * Get metadata including game data version
    */
   async getMetadata() {
     this.log('Fetching game metadata from Comlink...');
-    const metadata = await this.comlinkPost('/metadata', {});
+    const metadata = await this.comlink.post('/metadata', {});
     this.log(`Game version: ${metadata.latestGamedataVersion}`, 'success');
     return metadata;
   }
 
   /**
-   * Get localization bundle and parse it
+   * Get localization bundle and parse it into a Map of unit name strings
    */
   async getLocalization(version) {
     this.log('Fetching English localization bundle...');
-    const locData = await this.comlinkPost('/localization', {
+    const locData = await this.comlink.post('/localization', {
       payload: { id: `${version}:ENG_US` },
       unzip: true
     });
     
     // The localization bundle contains files - we need to parse Loc_ENG_US.txt
     // It's a key=value format
-    let locBundle = {};
+    const locBundle = new Map();
     
     if (locData['Loc_ENG_US.txt']) {
       const lines = locData['Loc_ENG_US.txt'].split('\n');
       for (const line of lines) {
+        // Only unit names (UNIT_*_NAME) are looked up, skip everything else early
+        if (!line.startsWith('UNIT_')) continue;
         const eqIdx = line.indexOf('|');
         if (eqIdx > 0) {
           const key = line.substring(0, eqIdx).trim();
           const value = line.substring(eqIdx + 1).trim();
-          locBundle[key] = value;
+          locBundle.set(key, value);
         }
       }
-      this.log(`Loaded ${Object.keys(locBundle).length} localization strings`, 'success');
+      this.log(`Loaded ${locBundle.size} unit localization strings`, 'success');
     } else {
       this.log('Localization format unexpected, using fallback names', 'warning');
     }
@@ -118,7 +98,7 @@ class ComlinkAssetSync {
    */
   async getUnits(version) {
     this.log('Fetching unit data (this may take a moment)...');
-    const gameData = await this.comlinkPost('/data', {
+    const gameData = await this.comlink.post('/data', {
       payload: {
         version: version,
         includePveUnits: false,
@@ -231,8 +211,9 @@ class ComlinkAssetSync {
     // nameKey is like "UNIT_BADBATCHECHO_NAME"
     const nameKey = unit.nameKey;
     
-    if (localization && nameKey && localization[nameKey]) {
-      return localization[nameKey];
+    const name = nameKey && localization?.get(nameKey);
+    if (name) {
+      return name;
     }
     
     // Fallback: format the baseId nicely
@@ -351,11 +332,11 @@ class ComlinkAssetSync {
         return;
       }
       
-      // Get localization for display names
-      const localization = await this.getLocalization(locVersion);
-      
-      // Get unit data
-      const units = await this.getUnits(gameVersion);
+      // Localization (display names) and unit data are independent downloads
+      const [localization, units] = await Promise.all([
+        this.getLocalization(locVersion),
+        this.getUnits(gameVersion)
+      ]);
       
       // Filter to unique playable units
       const seenBaseIds = new Set();
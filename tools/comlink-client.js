@@ -0,0 +1,43 @@
+/**
+ * Shared Comlink API client
+ *
+ * Single place for POSTing to a local swgoh-comlink instance, used by the
+ * sync, debug and test tools. Node's built-in fetch keeps connections alive,
+ * so every request made through one client reuses the same socket pool.
+ */
+
+const DEFAULT_COMLINK_URL = process.env.COMLINK_URL || 'http://localhost:3200';
+
+class ComlinkClient {
+  constructor(baseUrl = DEFAULT_COMLINK_URL, timeout = 120000) {
+    this.baseUrl = baseUrl;
+    this.timeout = timeout;
+  }
+
+  /**
+   * POST request to Comlink API
+   */
+  async post(endpoint, body = {}) {
+    try {
+      const response = await fetch(`${this.baseUrl}${endpoint}`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(body),
+        signal: AbortSignal.timeout(this.timeout)
+      });
+
+      if (!response.ok) {
+        throw new Error(`Comlink ${endpoint} failed: ${response.status}`);
+      }
+
+      return response.json();
+    } catch (error) {
+      if (error.cause?.code === 'ECONNREFUSED') {
+        throw new Error(`Comlink not running at ${this.baseUrl}. Start it with: docker start swgoh-comlink`);
+      }
+      throw error;
+    }
+  }
+}
+
+module.exports = ComlinkClient;
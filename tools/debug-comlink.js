@@ -2,51 +2,40 @@
 
 /**
  * Debug script to explore Comlink unit data structure
- * Using direct fetch
+ * Using the shared Comlink client
  */
 
-const COMLINK_URL = 'http://localhost:3200';
+const ComlinkClient = require('./comlink-client');
 
-async function post(endpoint, body = {}) {
-  const response = await fetch(`${COMLINK_URL}${endpoint}`, {
-    method: 'POST',
-    headers: { 'Content-Type': 'application/json' },
-    body: JSON.stringify(body)
-  });
-  if (!response.ok) {
-    throw new Error(`${endpoint} failed: ${response.status}`);
-  }
-  return response.json();
-}
+const comlink = new ComlinkClient();
 
 async function debug() {
   console.log('🔍 Exploring Comlink unit data structure...\n');
   
   try {
     // Get metadata
-    const metadata = await post('/metadata', {});
+    const metadata = await comlink.post('/metadata', {});
     console.log('Game version:', metadata.latestGamedataVersion);
     console.log('Localization version:', metadata.latestLocalizationBundleVersion);
     
-    // Get localization
-    console.log('\nFetching localization...');
-    const locBundle = await post('/localization', {
-      payload: { id: metadata.latestLocalizationBundleVersion + ':ENG_US' },
-      unzip: true
-    });
+    // Get localization and game data (segment 3 has units) concurrently
+    console.log('\nFetching localization and unit data (segment 3)...');
+    const [locBundle, gameData] = await Promise.all([
+      comlink.post('/localization', {
+        payload: { id: metadata.latestLocalizationBundleVersion + ':ENG_US' },
+        unzip: true
+      }),
+      comlink.post('/data', {
+        payload: {
+          version: metadata.latestGamedataVersion,
+          includePveUnits: false,
+          requestSegment: 3
+        },
+        enums: true
+      })
+    ]);
     console.log('Localization keys sample:', Object.keys(locBundle).slice(0, 5));
     
-    // Get game data - segment 3 has units
-    console.log('\nFetching unit data (segment 3)...');
-    const gameData = await post('/data', {
-      payload: {
-        version: metadata.latestGamedataVersion,
-        includePveUnits: false,
-        requestSegment: 3
-      },
-      enums: true
-    });
-    
     console.log('Game data keys:', Object.keys(gameData));
     
     if (gameData.units) {
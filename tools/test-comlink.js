@@ -4,7 +4,9 @@
  * Test Comlink API and explore data structure
  */
 
-const COMLINK_URL = 'http://localhost:3200';
+const ComlinkClient = require('./comlink-client');
+
+const comlink = new ComlinkClient();
 
 async function testComlink() {
   console.log('🔍 Testing Comlink API...\n');
@@ -12,32 +14,29 @@ async function testComlink() {
   try {
     // 1. Get metadata to find game data version
     console.log('1. Fetching metadata...');
-    const metadataRes = await fetch(`${COMLINK_URL}/metadata`, {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({})
-    });
-    const metadata = await metadataRes.json();
+    const metadata = await comlink.post('/metadata', {});
     
     console.log('  ✅ Metadata received');
     console.log('  Latest Game Data Version:', metadata.latestGamedataVersion);
     console.log('  Latest Localization Version:', metadata.latestLocalizationBundleVersion);
     
-    // 2. Get units data (segment 3 contains units)
-    console.log('\n2. Fetching units data (this may take a moment)...');
-    const unitsRes = await fetch(`${COMLINK_URL}/data`, {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({
+    // 2. Get units data (segment 3 contains units) and probe events alongside it
+    console.log('\n2. Fetching units data and events (this may take a moment)...');
+    const [dataResult, eventsResult] = await Promise.allSettled([
+      comlink.post('/data', {
         payload: {
           version: metadata.latestGamedataVersion,
           includePveUnits: false,
           requestSegment: 3  // Segment 3 contains units
         },
         enums: true
-      })
-    });
-    const gameData = await unitsRes.json();
+      }),
+      comlink.post('/getEvents', {})
+    ]);
+    if (dataResult.status === 'rejected') {
+      throw dataResult.reason;
+    }
+    const gameData = dataResult.value;
     
     console.log('  ✅ Game data received');
     console.log('  Available keys:', Object.keys(gameData).join(', '));
@@ -87,6 +86,14 @@ async function testComlink() {
       }
     }
     
+    // 5. Events endpoint (fetched concurrently with /data)
+    console.log('\n5. Events:');
+    if (eventsResult.status === 'fulfilled') {
+      console.log(`  ✅ ${(eventsResult.value.gameEvent || []).length} game events`);
+    } else {
+      console.log(`  ❌ /getEvents failed: ${eventsResult.reason.message}`);
+    }
+    
     console.log('\n✅ Comlink test complete!');
     
   } catch (error) {
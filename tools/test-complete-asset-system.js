@@ -8,6 +8,13 @@
 const fs = require('fs').promises;
 const path = require('path');
 
+const ASSET_URL_PATTERNS = [
+  ['swgoh.gg character', 'https://swgoh.gg/static/img/assets/char/{gameId}.png'],
+  ['swgoh.help character', 'https://api.swgoh.help/image/char/{gameId}'],
+  ['swgoh.gg ship', 'https://swgoh.gg/static/img/assets/ship/{gameId}.png'],
+  ['local fallback', '/assets/fallback/character-portrait.svg']
+];
+
 class CompleteAssetSystemTester {
   constructor() {
     this.baseUrl = 'http://localhost:5000/api/assets';
@@ -178,30 +185,36 @@ class CompleteAssetSystemTester {
   async testAssetURLPatterns() {
     console.log('\n🔗 Testing Asset URL Patterns...');
     
-    const patterns = {
-      'swgoh.gg character': 'https://swgoh.gg/static/img/assets/char/{gameId}.png',
-      'swgoh.help character': 'https://api.swgoh.help/image/char/{gameId}',
-      'swgoh.gg ship': 'https://swgoh.gg/static/img/assets/ship/{gameId}.png',
-      'local fallback': '/assets/fallback/character-portrait.svg'
-    };
+    // Fill in the template once up front, then probe all remote URLs at once
+    const urls = ASSET_URL_PATTERNS.map(([name, pattern]) =>
+      [name, pattern.replaceAll('{gameId}', 'COMMANDERLUKESKYWALKER')]
+    );
+
+    const probes = await Promise.all(urls.map(async ([name, testUrl]) => {
+      if (!testUrl.startsWith('http')) {
+        return { name, testUrl, local: true };
+      }
+      try {
+        const response = await fetch(testUrl, { 
+          method: 'HEAD',
+          signal: AbortSignal.timeout(3000)
+        });
+        return { name, testUrl, response };
+      } catch (error) {
+        return { name, testUrl, error };
+      }
+    }));
 
-    for (const [name, pattern] of Object.entries(patterns)) {
-      const testUrl = pattern.replace('{gameId}', 'COMMANDERLUKESKYWALKER');
+    for (const { name, testUrl, local, response, error } of probes) {
       console.log(`  🔗 ${name}: ${testUrl}`);
       
-      if (testUrl.startsWith('http')) {
-        try {
-          const response = await fetch(testUrl, { 
-            method: 'HEAD',
-            signal: AbortSignal.timeout(3000)
-          });
-          const status = response.ok ? '✅ Available' : '❌ Not accessible';
-          console.log(`      ${status} (${response.status})`);
-        } catch (error) {
-          console.log(`      ❌ Error: ${error.message}`);
-        }
-      } else {
+      if (local) {
         console.log(`      📁 Local asset pattern`);
+      } else if (error) {
+        console.log(`      ❌ Error: ${error.message}`);
+      } else {
+        const status = response.ok ? '✅ Available' : '❌ Not accessible';
+        console.log(`      ${status} (${response.status})`);
       }
     }
   }
@@ -212,26 +225,32 @@ class CompleteAssetSystemTester {
   async testFallbackStrategy() {
     console.log('\n🔄 Testing Fallback Strategy...');
     
-    for (const unit of this.testUnits) {
-      console.log(`\n  📋 Testing ${unit.gameId} (${unit.type})...`);
-      
+    // Probes are independent, so fire them together and report in order
+    const results = await Promise.all(this.testUnits.map(async (unit) => {
       try {
         const response = await fetch(`${this.baseUrl}/unit/${unit.gameId}/portrait`);
-        
-        if (response.ok) {
-          const data = await response.json();
-          console.log(`    ✅ Got asset URL: ${data.url}`);
-          
-          if (data.sources) {
-            console.log(`    🔗 Primary: ${data.sources.primary}`);
-            console.log(`    🔗 Fallback: ${data.sources.fallback}`);
-            console.log(`    🔗 Local: ${data.sources.local}`);
-          }
-        } else {
-          console.log(`    ❌ API failed (${response.status})`);
-        }
+        const data = response.ok ? await response.json() : null;
+        return { unit, status: response.status, data };
       } catch (error) {
+        return { unit, error };
+      }
+    }));
+    
+    for (const { unit, status, data, error } of results) {
+      console.log(`\n  📋 Testing ${unit.gameId} (${unit.type})...`);
+      
+      if (error) {
         console.log(`    ❌ Request failed: ${error.message}`);
+      } else if (data) {
+        console.log(`    ✅ Got asset URL: ${data.url}`);
+        
+        if (data.sources) {
+          console.log(`    🔗 Primary: ${data.sources.primary}`);
+          console.log(`    🔗 Fallback: ${data.sources.fallback}`);
+          console.log(`    🔗 Local: ${data.sources.local}`);
+        }
+      } else {
+        console.log(`    ❌ API failed (${status})`);
       }
     }
   }